@@ -4,6 +4,7 @@ symrock: SymPy-based 1D rocket mechanics lab.
 
 This package currently provides:
 - vertical_rocket_equations() – symbolic 1D equations of motion,
+- vertical_rocket_rhs_numeric() – lambdified numeric RHS of those equations,
 - tsiolkovsky_delta_v(...)   – ideal rocket Δv formula,
 - VerticalRocketModel        – small container for the symbolic model.
 """
@@ -18,6 +19,7 @@ from .rocket_1d import (
     D,
     mdot,
     vertical_rocket_equations,
+    vertical_rocket_rhs_numeric,
     tsiolkovsky_delta_v,
     VerticalRocketModel,
 )
@@ -32,6 +34,7 @@ __all__ = [
     "D",
     "mdot",
     "vertical_rocket_equations",
+    "vertical_rocket_rhs_numeric",
     "tsiolkovsky_delta_v",
     "VerticalRocketModel",
 ]
@@ -0,0 +1,57 @@
+"""
+C-callable right-hand sides of the rocket model for numbalsoda's LSODA.
+
+Imported lazily by ``integrators.integrate_vertical_rocket_lsoda``;
+requires Numba and numbalsoda.
+"""
+
+import functools
+
+from numba import cfunc
+from numba.core.ccallback import CFunc
+from numbalsoda import lsoda_sig
+
+
+@cfunc(lsoda_sig)
+def _rhs_nodrag(t, u, du, p):
+    """RHS without drag; p = [T, g, mdot]. Frozen once m <= 0."""
+    m = u[2]
+    if m <= 0.0:
+        du[0] = 0.0
+        du[1] = 0.0
+        du[2] = 0.0
+        return
+    du[0] = u[1]
+    du[1] = p[0] / m - p[1]
+    du[2] = -p[2]
+
+
+@functools.lru_cache(maxsize=None)
+def rhs_cfunc(drag_fn):
+    """
+    Return the LSODA RHS cfunc for a drag model.
+
+    ``drag_fn`` is None, a ``numba.cfunc(drag_sig)`` or an ``@numba.njit``
+    function. One cfunc is compiled per drag model and kept alive here,
+    so its ``.address`` stays valid.
+    """
+    if drag_fn is None:
+        return _rhs_nodrag
+
+    drag = drag_fn.ctypes if isinstance(drag_fn, CFunc) else drag_fn
+
+    @cfunc(lsoda_sig)
+    def rhs(t, u, du, p):
+        h = u[0]
+        v = u[1]
+        m = u[2]
+        if m <= 0.0:
+            du[0] = 0.0
+            du[1] = 0.0
+            du[2] = 0.0
+            return
+        du[0] = v
+        du[1] = (p[0] - drag(t, h, v, m) - m * p[1]) / m
+        du[2] = -p[2]
+
+    return rhs
@@ -0,0 +1,107 @@
+# cython: language_level=3
+"""
+Pre-compiled RK4 driver for the 1D vertical rocket model.
+
+Same scheme and mass-depletion handling as the loops in integrators.py,
+but built ahead of time: there is no JIT warm-up on the first call, and
+a plain Python drag_fn is called directly from the C loop.
+"""
+
+cimport cython
+from cython cimport floating
+
+
+cdef inline double _rhs_v(
+    double T, double D, double m, double g
+) noexcept nogil:
+    """Velocity RHS dv/dt = (T - D - m*g) / m."""
+    return (T - D - m * g) / m
+
+
+cdef inline double _drag(
+    object drag_fn, double t, double h, double v, double m
+):
+    """Evaluate drag_fn(t, h, v, m), or 0.0 if drag_fn is None."""
+    if drag_fn is None:
+        return 0.0
+    return drag_fn(t, h, v, m)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef void integrate_rk4_c(
+    floating[:, ::1] y,
+    double t0,
+    double dt,
+    Py_ssize_t i_burn,
+    double h0,
+    double v0,
+    double m0,
+    double T,
+    double g,
+    double mdot,
+    object drag_fn,
+):
+    """
+    RK4 on a uniform grid starting at t0, written into y.
+
+    y has shape (3, n_steps) with rows h, v, m, and may be float32 or
+    float64; the arithmetic is always done in double. i_burn >= 1 is the
+    first node with m <= 0: nodes 1 .. i_burn - 1 are integrated, and
+    from i_burn on the state is frozen. The mass is evaluated from its
+    linear law, so no stage of an integrated step has m <= 0.
+    """
+    cdef floating[::1] h = y[0]
+    cdef floating[::1] v = y[1]
+    cdef floating[::1] m = y[2]
+
+    cdef Py_ssize_t i
+    cdef double ti, hi = h0, vi = v0, mi = m0
+    cdef double half_dt, dt_6
+    cdef double h2, m2, h3, h4, m4
+    cdef double k1h, k1v, k2h, k2v, k3h, k3v, k4h, k4v
+
+    h[0] = hi
+    v[0] = vi
+    m[0] = mi
+
+    # Step constants, hoisted out of the loop.
+    half_dt = 0.5 * dt
+    dt_6 = dt / 6.0
+
+    for i in range(i_burn - 1):
+        ti = t0 + i * dt
+        m2 = mi - half_dt * mdot
+        m4 = m0 - mdot * ((i + 1) * dt)
+
+        # Stage 1
+        k1h = vi
+        k1v = _rhs_v(T, _drag(drag_fn, ti, hi, vi, mi), mi, g)
+
+        # Stage 2
+        h2 = hi + half_dt * k1h
+        k2h = vi + half_dt * k1v
+        k2v = _rhs_v(T, _drag(drag_fn, ti + half_dt, h2, k2h, m2), m2, g)
+
+        # Stage 3
+        h3 = hi + half_dt * k2h
+        k3h = vi + half_dt * k2v
+        k3v = _rhs_v(T, _drag(drag_fn, ti + half_dt, h3, k3h, m2), m2, g)
+
+        # Stage 4
+        h4 = hi + dt * k3h
+        k4h = vi + dt * k3v
+        k4v = _rhs_v(T, _drag(drag_fn, ti + dt, h4, k4h, m4), m4, g)
+
+        hi += dt_6 * (k1h + 2.0 * k2h + 2.0 * k3h + k4h)
+        vi += dt_6 * (k1v + 2.0 * k2v + 2.0 * k3v + k4v)
+        mi = m4
+        h[i + 1] = hi
+        v[i + 1] = vi
+        m[i + 1] = mi
+
+    # Freeze the state after mass depletion.
+    h[i_burn:] = hi
+    v[i_burn:] = 0.0
+    m[i_burn:] = 0.0
@@ -20,20 +20,91 @@ Equations (consistent with rocket_1d.py):
 
 This is a teaching-oriented integrator, not a production flight
 dynamics solver.
+
+If Numba is installed, the RK4 loops are compiled with ``@njit``. This
+covers the no-drag case and drag models compiled with ``@numba.njit`` or
+``numba.cfunc(drag_sig)``; a plain Python ``drag_fn`` runs the same loop
+uncompiled, unless the optional Cython extension ``symrock._rk4`` was
+built with the package, in which case that pre-compiled loop is used.
 """
 
 from __future__ import annotations
 
+import ctypes
+import functools
+import sys
 from dataclasses import dataclass
-from typing import Callable, Dict
+from typing import Callable, ClassVar, Dict, Iterator, Sequence, Tuple
 
 import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+try:
+    from numba import njit, prange, types
+    from numba.core.ccallback import CFunc
+    from numba.extending import is_jitted, overload
+except ImportError:  # pragma: no cover - Numba is an optional dependency
+    njit = None
+    prange = range
+    types = None
+    CFunc = None
+    is_jitted = None
+    overload = None
+
+try:
+    from ._rk4 import integrate_rk4_c
+except ImportError:  # pragma: no cover - the Cython extension is optional
+    integrate_rk4_c = None
 
 
 DragFn = Callable[[float, float, float, float], float]
 
+# dataclass(slots=True) needs Python 3.10; older versions keep __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Signature for drag models compiled with ``numba.cfunc(drag_sig)``.
+drag_sig = None if types is None else types.float64(*([types.float64] * 4))
+
+# C function pointer type matching ``drag_sig``.
+_DragFnPtr = ctypes.CFUNCTYPE(ctypes.c_double, *([ctypes.c_double] * 4))
+
+
+def _jit(**options):
+    """Apply ``numba.njit(**options)`` if Numba is available, else no-op."""
+
+    def decorator(fn):
+        if njit is None:
+            return fn
+        return njit(**options)(fn)
+
+    return decorator
+
+
+def _like(x, ref):
+    """
+    Return ``x`` converted to the floating type of ``ref``.
+
+    Used in the RK4 loops for values built from float64 literals (``0.5 *
+    dt``, ``0.0``) or returned by drag models: compiled for float32, they
+    would otherwise promote the whole loop to float64. Interpreted, ``x``
+    is returned as is, so Python floats stay Python floats.
+    """
+    return x
+
+
+if overload is not None:
+
+    @overload(_like)
+    def _like_overload(x, ref):
+        to = ref
 
-@dataclass
+        def impl(x, ref):
+            return to(x)
+
+        return impl
+
+
+@dataclass(frozen=True, **_SLOTS)
 class RocketParams:
     """
     Numeric parameters for the vertical rocket integration.
@@ -48,6 +119,15 @@ class RocketParams:
         Mass flow rate [kg/s]. The mass decreases as dm/dt = -mdot.
     drag_fn : callable or None
         Optional drag model D(t, h, v, m) [N]. If None, drag is set to 0.
+        A plain Python function works everywhere but keeps the RK4 loop
+        interpreted. For compiled integration (Numba installed) use either
+        an ``@numba.njit`` function or a ``numba.cfunc(drag_sig)``; the
+        latter is passed to the loop as a C function pointer, so all
+        cfunc drag models share a single compiled loop.
+
+    Instances are immutable (use ``dataclasses.replace`` to derive a
+    variant) and, on Python >= 3.10, use ``__slots__`` instead of a
+    per-instance ``__dict__``.
     """
 
     T: float
@@ -62,7 +142,60 @@ class RocketParams:
         return float(self.drag_fn(t, h, v, m))
 
 
-def rocket_rhs(t: float, y: np.ndarray, params: RocketParams) -> np.ndarray:
+@dataclass(frozen=True, eq=False, **_SLOTS)
+class TrajectoryResult:
+    """
+    Trajectory returned by the single-trajectory integrators.
+
+    Attributes
+    ----------
+    t : ndarray
+        Time nodes [s].
+    h, v, m : ndarray
+        Altitude [m], vertical velocity [m/s] and mass [kg] at the nodes.
+
+    Fields are read as attributes (``res.h``). For code written against
+    the earlier dict results, the read-only mapping protocol is kept as
+    well: ``res["h"]``, ``"h" in res``, ``keys()``, iteration over the
+    names and ``dict(res)``; ``as_dict()`` returns the dict directly.
+    """
+
+    t: np.ndarray
+    h: np.ndarray
+    v: np.ndarray
+    m: np.ndarray
+
+    _KEYS: ClassVar[Tuple[str, ...]] = ("t", "h", "v", "m")
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """Field by name, as for the earlier dict results."""
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, in the order of the earlier dict results."""
+        return self._KEYS
+
+    def as_dict(self) -> Dict[str, np.ndarray]:
+        """Return the fields as a dict; the arrays are not copied."""
+        return {key: getattr(self, key) for key in self._KEYS}
+
+
+def rocket_rhs(
+    t: float,
+    y: Sequence[float],
+    params: RocketParams,
+) -> Tuple[float, float, float]:
     """
     Right-hand side of the 1D vertical rocket ODE system.
 
@@ -70,21 +203,22 @@ def rocket_rhs(t: float, y: np.ndarray, params: RocketParams) -> np.ndarray:
     ----------
     t : float
         Current time.
-    y : ndarray, shape (3,)
-        Current state [h, v, m].
+    y : sequence of float, length 3
+        Current state (h, v, m); a tuple or an ndarray.
     params : RocketParams
         Numeric parameters (T, g, mdot, drag_fn).
 
     Returns
     -------
-    ndarray, shape (3,)
-        Time derivative dy/dt = [dh/dt, dv/dt, dm/dt].
+    tuple of float
+        Time derivative (dh/dt, dv/dt, dm/dt). A plain tuple is returned
+        so that the RK4 loop does not allocate an array per stage.
     """
     h, v, m = y
 
     # Once mass is depleted, freeze the state.
     if m <= 0.0:
-        return np.array([0.0, 0.0, 0.0], dtype=float)
+        return 0.0, 0.0, 0.0
 
     D = params.eval_drag(t, h, v, m)
 
@@ -92,7 +226,471 @@ def rocket_rhs(t: float, y: np.ndarray, params: RocketParams) -> np.ndarray:
     dvdt = (params.T - D - m * params.g) / m
     dmdt = -params.mdot
 
-    return np.array([dhdt, dvdt, dmdt], dtype=float)
+    return dhdt, dvdt, dmdt
+
+
+@_jit(cache=True, fastmath=True)
+def _rk4_nodrag(y, t0, dt, i_burn, h0, v0, m0, T, g, mdot):
+    """
+    Scalar RK4 loop for the state [h, v, m] without drag.
+
+    Fills ``y`` of shape (3, n_steps), rows h, v, m. The loop is compiled
+    once per dtype of ``y`` (float32 or float64) and computes in that
+    dtype: the scalar arguments must already have it, and constants are
+    converted with ``_like``.
+
+    With D = 0 the velocity RHS folds to dv/dt = T/m - g, i.e. one
+    division and one subtraction per stage; stages 2 and 3 see the same
+    mass, so they share it.
+
+    ``i_burn`` (>= 1) is the first node at which the mass is exhausted
+    (see ``_burnout_index``). Only nodes 1 .. i_burn - 1 are integrated;
+    from i_burn on the state is frozen (h held, v = m = 0). RK4 is exact
+    for the linear mass, so m is evaluated as m0 - mdot*(t - t0) instead
+    of being accumulated: it does not drift, and every stage of a step
+    ending before node i_burn has positive mass, with no check needed.
+    """
+    h = y[0]
+    v = y[1]
+    m = y[2]
+
+    hi = h0
+    vi = v0
+    mi = m0
+    h[0] = hi
+    v[0] = vi
+    m[0] = mi
+
+    # Step constants, hoisted out of the loop, in the dtype of y.
+    half_dt = _like(0.5 * dt, dt)
+    dt_6 = _like(dt / 6.0, dt)
+
+    for i in range(i_burn - 1):
+        m2 = mi - half_dt * mdot
+        m4 = m0 - mdot * _like((i + 1) * dt, dt)
+
+        # Stage 1
+        k1h = vi
+        k1v = T / mi - g
+
+        # Stages 2 and 3
+        k2h = vi + half_dt * k1v
+        k2v = T / m2 - g
+        k3h = vi + half_dt * k2v
+
+        # Stage 4
+        k4h = vi + dt * k2v
+        k4v = T / m4 - g
+
+        hi += dt_6 * (k1h + (k2h + k2h) + (k3h + k3h) + k4h)
+        vi += dt_6 * (k1v + (k2v + k2v) + (k2v + k2v) + k4v)
+        mi = m4
+        h[i + 1] = hi
+        v[i + 1] = vi
+        m[i + 1] = mi
+
+    # Freeze the state after mass depletion.
+    h[i_burn:] = hi
+    v[i_burn:] = 0.0
+    m[i_burn:] = 0.0
+
+
+@_jit(cache=True, fastmath=True)
+def _rk4_drag(drag_fn, y, t0, dt, i_burn, h0, v0, m0, T, g, mdot):
+    """
+    Scalar RK4 loop for the state [h, v, m] with a drag model D(t, h, v, m).
+
+    Fills ``y`` as in ``_rk4_nodrag``.
+
+    Compiled, ``drag_fn`` must be an ``@njit`` function or a ctypes
+    function pointer (see ``_compiled_drag``). The uncompiled
+    ``_rk4_drag.py_func`` accepts any Python callable. ``i_burn`` and
+    the mass are handled as in ``_rk4_nodrag``.
+    """
+    h = y[0]
+    v = y[1]
+    m = y[2]
+
+    hi = h0
+    vi = v0
+    mi = m0
+    h[0] = hi
+    v[0] = vi
+    m[0] = mi
+
+    # Step constants, hoisted out of the loop, in the dtype of y.
+    half_dt = _like(0.5 * dt, dt)
+    dt_6 = _like(dt / 6.0, dt)
+
+    for i in range(i_burn - 1):
+        ti = _like(t0 + i * dt, dt)
+        m2 = mi - half_dt * mdot
+        m4 = m0 - mdot * _like((i + 1) * dt, dt)
+
+        # Stage 1
+        k1h = vi
+        D = _like(drag_fn(ti, hi, vi, mi), dt)
+        k1v = (T - D - mi * g) / mi
+
+        # Stage 2
+        h2 = hi + half_dt * k1h
+        k2h = vi + half_dt * k1v
+        D = _like(drag_fn(ti + half_dt, h2, k2h, m2), dt)
+        k2v = (T - D - m2 * g) / m2
+
+        # Stage 3
+        h3 = hi + half_dt * k2h
+        k3h = vi + half_dt * k2v
+        D = _like(drag_fn(ti + half_dt, h3, k3h, m2), dt)
+        k3v = (T - D - m2 * g) / m2
+
+        # Stage 4
+        h4 = hi + dt * k3h
+        k4h = vi + dt * k3v
+        D = _like(drag_fn(ti + dt, h4, k4h, m4), dt)
+        k4v = (T - D - m4 * g) / m4
+
+        hi += dt_6 * (k1h + (k2h + k2h) + (k3h + k3h) + k4h)
+        vi += dt_6 * (k1v + (k2v + k2v) + (k3v + k3v) + k4v)
+        mi = m4
+        h[i + 1] = hi
+        v[i + 1] = vi
+        m[i + 1] = mi
+
+    # Freeze the state after mass depletion.
+    h[i_burn:] = hi
+    v[i_burn:] = 0.0
+    m[i_burn:] = 0.0
+
+
+def _compiled_drag(drag_fn: DragFn):
+    """
+    Return ``drag_fn`` in a form ``_rk4_drag`` can call when compiled.
+
+    A ``numba.cfunc`` is wrapped as a ctypes function pointer built from
+    its ``.address``. Returns None for a plain Python callable, or if
+    Numba is not installed.
+    """
+    if njit is None:
+        return None
+    if isinstance(drag_fn, CFunc):
+        return _DragFnPtr(drag_fn.address)
+    if is_jitted(drag_fn):
+        return drag_fn
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _specialized_rk4(with_drag: bool, dtype: str, T, g, mdot):
+    """
+    Compile ``_rk4_drag`` or ``_rk4_nodrag`` with T, g and mdot baked in
+    as constants.
+
+    The loop body is inlined (at the Numba IR level) into a closure over
+    T, g and mdot; Numba freezes closure variables as compile-time
+    constants of their own type, so LLVM can fold them into the stage
+    expressions (e.g. ``T / m - g``) and float32 constants stay float32.
+    The result takes the remaining arguments
+    ``([drag_fn,] y, t0, dt, i_burn, h0, v0, m0)``.
+
+    ``dtype`` (of y) is part of the cache key because equal float32 and
+    float64 constants hash alike. Each entry costs one Numba compilation.
+    """
+    body = njit(fastmath=True, inline="always")(
+        (_rk4_drag if with_drag else _rk4_nodrag).py_func
+    )
+
+    if with_drag:
+
+        def loop(drag_fn, y, t0, dt, i_burn, h0, v0, m0):
+            body(drag_fn, y, t0, dt, i_burn, h0, v0, m0, T, g, mdot)
+
+    else:
+
+        def loop(y, t0, dt, i_burn, h0, v0, m0):
+            body(y, t0, dt, i_burn, h0, v0, m0, T, g, mdot)
+
+    return njit(fastmath=True)(loop)
+
+
+def _rk4(
+    drag_fn: DragFn | None,
+    y: np.ndarray,
+    args: tuple,
+    specialize: bool = False,
+) -> None:
+    """
+    Run the fastest available RK4 loop, filling the (3, n_steps) array y.
+
+    ``args`` is (t0, dt, i_burn, h0, v0, m0, T, g, mdot). Order of
+    preference: Numba-compiled loop, Cython extension, plain Python.
+    With ``specialize``, the Numba loop is the one compiled for these
+    T, g, mdot by ``_specialized_rk4``.
+    """
+    if njit is not None:
+        compiled_drag = None if drag_fn is None else _compiled_drag(drag_fn)
+        if specialize and (drag_fn is None or compiled_drag is not None):
+            loop = _specialized_rk4(
+                drag_fn is not None, y.dtype.str, *args[6:]
+            )
+            if drag_fn is None:
+                loop(y, *args[:6])
+            else:
+                loop(compiled_drag, y, *args[:6])
+            return
+        if drag_fn is None:
+            _rk4_nodrag(y, *args)
+            return
+        if compiled_drag is not None:
+            _rk4_drag(compiled_drag, y, *args)
+            return
+
+    if integrate_rk4_c is not None:
+        integrate_rk4_c(y, *args, drag_fn)
+    elif drag_fn is None:
+        getattr(_rk4_nodrag, "py_func", _rk4_nodrag)(y, *args)
+    else:
+        getattr(_rk4_drag, "py_func", _rk4_drag)(drag_fn, y, *args)
+
+
+@_jit(parallel=True, cache=True)
+def _rk4_batch(
+    out, drag_fn, t0, dt, i_burns, h0s, v0s, m0s, T_arr, g_arr, mdot_arr
+):
+    """
+    Run the RK4 loop for every trajectory k, in parallel over k.
+
+    ``out`` has shape (n_traj, 3, n_steps); the per-trajectory inputs are
+    1D arrays (structure of arrays). ``drag_fn`` is None or a compiled
+    drag model shared by all trajectories.
+    """
+    for k in prange(out.shape[0]):
+        args = (
+            t0,
+            dt,
+            i_burns[k],
+            h0s[k],
+            v0s[k],
+            m0s[k],
+            T_arr[k],
+            g_arr[k],
+            mdot_arr[k],
+        )
+        if drag_fn is None:
+            _rk4_nodrag(out[k], *args)
+        else:
+            _rk4_drag(drag_fn, out[k], *args)
+
+
+def _burnout_nodes(
+    t: np.ndarray, m0: ArrayLike, mdot: ArrayLike
+) -> np.ndarray:
+    """
+    Vectorized ``_burnout_index`` over arrays of m0 and mdot.
+
+    A node is burned once its mass m0 - mdot*(t - t[0]) is no longer
+    positive. Node times carry rounding error, so comparing them with a
+    computed t[0] + m0/mdot can leave a node whose mass is exactly 0 just
+    below it, and that node would count as live. Masses up to a few ulps
+    of the terms they are computed from therefore count as exhausted.
+    """
+    m0 = np.asarray(m0, dtype=np.float64)
+    mdot = np.asarray(mdot, dtype=np.float64)
+
+    t_scale = max(abs(float(t[0])), abs(float(t[-1])))
+    tol = 8.0 * np.finfo(t.dtype).eps * (np.abs(m0) + np.abs(mdot) * t_scale)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_burn = float(t[0]) + (m0 - tol) / mdot
+
+    nodes = np.searchsorted(t, t_burn, side="left").astype(np.int64)
+    nodes = np.where(mdot <= 0.0, t.shape[0], nodes)
+    return np.where(m0 <= 0.0, 0, nodes)
+
+
+def _burnout_index(t: np.ndarray, m0: float, mdot: float) -> int:
+    """
+    Index of the first node of ``t`` at which the mass is exhausted.
+
+    Mass decreases linearly, so burnout happens at t[0] + m0/mdot; see
+    ``_burnout_nodes`` for how nodes at burnout are detected despite
+    rounding. Returns 0 if m0 <= 0 and len(t) if the mass never runs out.
+    """
+    return int(_burnout_nodes(t, m0, mdot))
+
+
+# Samples evaluated at once by the batched closed form (per block of
+# trajectories).
+_CLOSED_FORM_BLOCK = 1 << 16
+
+
+def _closed_form_nodrag(
+    y: np.ndarray,
+    t: np.ndarray,
+    h0: ArrayLike,
+    v0: ArrayLike,
+    m0: ArrayLike,
+    T: ArrayLike,
+    g: ArrayLike,
+    mdot: ArrayLike,
+) -> None:
+    """
+    Exact no-drag solution sampled at times ``t`` (with t[0] = t0).
+
+    With m(t) = m0 - mdot*tau and tau = t - t0:
+
+        v = v0 - g*tau + (T/mdot) * ln(m0/m)
+        h = h0 + v0*tau - g*tau^2/2 + (T/mdot) * (tau - (m/mdot) * ln(m0/m))
+
+    Samples at or after burnout are frozen (h constant, v = 0, m = 0).
+    The result is written into ``y`` of shape (..., 3, len(t)), rows h,
+    v, m. The initial conditions and parameters are scalars or arrays of
+    shape y.shape[:-2], one value per trajectory.
+    """
+    # Evaluate in float64 whatever the output dtype: the h formula
+    # subtracts nearly equal terms at small tau.
+    h0, v0, m0, T, g, mdot = (
+        np.asarray(x, dtype=np.float64) for x in (h0, v0, m0, T, g, mdot)
+    )
+    # Number of leading samples with positive mass, per trajectory.
+    n_live = _burnout_nodes(t, m0, mdot)[..., None]
+    h0, v0, m0, T, g, mdot = (
+        x[..., None] for x in (h0, v0, m0, T, g, mdot)
+    )
+
+    # Only nodes before the last burnout are evaluated; t[0] always is.
+    n_eval = max(1, int(n_live.max()))
+    tau = t[:n_eval].astype(np.float64) - float(t[0])
+    half_tau2 = 0.5 * tau**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m_t = m0 - mdot * tau
+        # Never take the log of an exhausted mass: such nodes stay frozen.
+        live = m_t > 0.0
+        if n_live.min() < n_eval:
+            live &= np.arange(n_eval) < n_live
+        all_live = bool(live.all())
+        if not all_live:
+            m_t = np.where(live, m_t, 1.0)
+        log_ratio = np.log(m0 / m_t)
+        c = T / mdot
+        # h = h0 + (v0 + c)*tau - g*tau^2/2 - (c/mdot) * m * ln(m0/m)
+        v = v0 - g * tau + c * log_ratio
+        h = (v0 + c) * tau
+        h -= g * half_tau2
+        h -= (c / mdot) * m_t * log_ratio
+        h += h0
+
+        const_mass = mdot == 0.0
+        if np.any(const_mass):
+            a = T / m0 - g
+            v = np.where(const_mass, v0 + a * tau, v)
+            h = np.where(const_mass, h0 + v0 * tau + a * half_tau2, h)
+
+    # t[0] keeps the initial state, even without mass (m0 <= 0).
+    live[..., 0] = True
+    h[..., 0], v[..., 0], m_t[..., 0] = h0[..., 0], v0[..., 0], m0[..., 0]
+
+    n_live = np.count_nonzero(live, axis=-1)[..., None]
+    h_burn = np.take_along_axis(h, n_live - 1, axis=-1)
+    if all_live:
+        y[..., 0, :n_eval] = h
+        y[..., 1, :n_eval] = v
+        y[..., 2, :n_eval] = m_t
+    else:
+        y[..., 0, :n_eval] = np.where(live, h, h_burn)
+        y[..., 1, :n_eval] = np.where(live, v, 0.0)
+        y[..., 2, :n_eval] = np.where(live, m_t, 0.0)
+    y[..., 0, n_eval:] = h_burn
+    y[..., 1:, n_eval:] = 0.0
+
+
+def _time_grid(
+    t0: float, t_end: float, dt: float, dtype: DTypeLike = np.float64
+) -> np.ndarray:
+    """Validate (t0, t_end, dt) and return the uniform grid of nodes."""
+    if dt <= 0.0:
+        raise ValueError("Time step dt must be positive.")
+    if t_end <= t0:
+        raise ValueError("t_end must be greater than t0.")
+
+    n_steps = int(np.floor((t_end - t0) / dt)) + 1
+    # t0 + i*dt, built in place in float64 (no temporaries), then cast.
+    t = np.arange(n_steps, dtype=np.float64)
+    t *= dt
+    t += t0
+    return t.astype(dtype, copy=False)
+
+
+def _check_dtype(dtype: DTypeLike) -> np.dtype:
+    """Validate an output dtype (float32 or float64)."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}.")
+    return dtype
+
+
+def _batch_inputs(
+    params_list: Sequence[RocketParams],
+    h0s: ArrayLike,
+    v0s: ArrayLike,
+    m0s: ArrayLike,
+    t: np.ndarray,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Per-trajectory inputs of a batch as contiguous 1D arrays of t.dtype.
+
+    Returns (i_burns, h0s, v0s, m0s, T_arr, g_arr, mdot_arr); scalar
+    initial conditions are broadcast to all trajectories. i_burns[k] is
+    the first frozen node of trajectory k, as in ``_integrate_into``.
+    """
+    n_traj = len(params_list)
+
+    def column(values):
+        values = np.broadcast_to(np.asarray(values, dtype=t.dtype), (n_traj,))
+        return np.ascontiguousarray(values)
+
+    h0s, v0s, m0s = column(h0s), column(v0s), column(m0s)
+    T_arr = column([p.T for p in params_list])
+    g_arr = column([p.g for p in params_list])
+    mdot_arr = column([p.mdot for p in params_list])
+
+    i_burns = np.maximum(_burnout_nodes(t, m0s, mdot_arr), 1)
+    return i_burns, h0s, v0s, m0s, T_arr, g_arr, mdot_arr
+
+
+def _integrate_into(
+    y: np.ndarray,
+    t: np.ndarray,
+    dt: float,
+    h0: float,
+    v0: float,
+    m0: float,
+    params: RocketParams,
+    method: str,
+    specialize: bool = False,
+) -> None:
+    """
+    Fill ``y`` (shape (3, len(t))) with one trajectory on the grid ``t``
+    of spacing ``dt``.
+
+    Scalars are converted to ``y.dtype`` first, so the compiled loops are
+    specialized for float32 or float64.
+    """
+    # Python floats keep the uncompiled fallback loop fast for float64.
+    cast = float if y.dtype == np.float64 else y.dtype.type
+    T, g, mdot = cast(params.T), cast(params.g), cast(params.mdot)
+    h0, v0, m0, dt = cast(h0), cast(v0), cast(m0), cast(dt)
+
+    drag_fn = params.drag_fn
+    if drag_fn is None and method == "auto":
+        _closed_form_nodrag(y, t, h0, v0, m0, T, g, mdot)
+        return
+
+    # First frozen node: the first node with m <= 0 (t[0] is always kept).
+    i_burn = max(1, _burnout_index(t, m0, mdot))
+
+    args = (t[0], dt, i_burn, h0, v0, m0, T, g, mdot)
+    _rk4(drag_fn, y, args, specialize)
 
 
 def integrate_vertical_rocket(
@@ -103,10 +701,22 @@ def integrate_vertical_rocket(
     v0: float,
     m0: float,
     params: RocketParams,
-) -> Dict[str, np.ndarray]:
+    method: str = "auto",
+    dtype: DTypeLike = np.float64,
+    specialize: bool = False,
+) -> TrajectoryResult:
     """
     Integrate the 1D vertical rocket model using RK4 on a uniform grid.
 
+    Without drag the ODE has a closed-form solution; with the default
+    ``method="auto"`` it is evaluated directly on the time grid with a few
+    vectorized NumPy operations instead of stepping RK4.
+
+    With Numba installed, the RK4 loop runs compiled when
+    ``params.drag_fn`` is None, an ``@njit`` function or a
+    ``numba.cfunc(drag_sig)``. Otherwise the Cython loop from
+    ``symrock._rk4`` is used if it was built.
+
     Parameters
     ----------
     t0 : float
@@ -123,52 +733,479 @@ def integrate_vertical_rocket(
         Initial mass [kg].
     params : RocketParams
         Numeric parameters for the rocket.
+    method : {"auto", "rk4"}
+        "auto" uses the exact solution when ``params.drag_fn`` is None and
+        RK4 otherwise; "rk4" always integrates with RK4.
+    dtype : np.float64 or np.float32
+        Floating-point type of the returned arrays. The inputs are
+        converted to it, and the compiled loop is specialized for it.
+        float32 halves the memory traffic and is usually accurate enough
+        for Monte-Carlo dispersion runs.
+    specialize : bool
+        With Numba, run an RK4 loop compiled for this particular
+        (T, g, mdot), so the constants are folded into the machine code.
+        Compiled loops are cached for the 32 most recent parameter sets;
+        worthwhile when the same parameters are integrated many times
+        (long grids, repeated calls), since each new set compiles once.
+        Ignored without Numba or when the RK4 loop is not used.
 
     Returns
     -------
-    dict
-        {
-          "t": ndarray,  # time nodes
-          "h": ndarray,  # altitude profile
-          "v": ndarray,  # velocity profile
-          "m": ndarray,  # mass profile
-        }
+    TrajectoryResult
+        Time nodes ``t`` and the profiles ``h``, ``v``, ``m``. The three
+        profiles are row views of one (3, n_steps) array.
     """
-    if dt <= 0.0:
-        raise ValueError("Time step dt must be positive.")
-    if t_end <= t0:
-        raise ValueError("t_end must be greater than t0.")
+    if method not in ("auto", "rk4"):
+        raise ValueError(f"Unknown method {method!r}; use 'auto' or 'rk4'.")
+    dtype = _check_dtype(dtype)
+    t = _time_grid(t0, t_end, dt, dtype)
 
-    n_steps = int(np.floor((t_end - t0) / dt)) + 1
-    t = t0 + np.arange(n_steps) * dt
+    y = np.empty((3, t.shape[0]), dtype=dtype)
+    _integrate_into(y, t, dt, h0, v0, m0, params, method, specialize)
 
-    h = np.zeros(n_steps, dtype=float)
-    v = np.zeros(n_steps, dtype=float)
-    m = np.zeros(n_steps, dtype=float)
+    return TrajectoryResult(t, y[0], y[1], y[2])
 
-    h[0] = float(h0)
-    v[0] = float(v0)
-    m[0] = float(m0)
 
-    for i in range(n_steps - 1):
-        y = np.array([h[i], v[i], m[i]], dtype=float)
+def integrate_batch(
+    params_list: Sequence[RocketParams],
+    h0s: ArrayLike,
+    v0s: ArrayLike,
+    m0s: ArrayLike,
+    t0: float,
+    t_end: float,
+    dt: float,
+    method: str = "auto",
+    dtype: DTypeLike = np.float32,
+) -> np.ndarray:
+    """
+    Integrate many independent trajectories on a common time grid.
+
+    Intended for Monte-Carlo dispersion studies: each trajectory has its
+    own parameters and initial state, and all results are stored in one
+    array, in float32 by default.
 
-        # If mass is exhausted, freeze the state for remaining steps.
-        if m[i] <= 0.0:
-            h[i + 1 :] = h[i]
-            v[i + 1 :] = 0.0
-            m[i + 1 :] = 0.0
-            break
+    With Numba installed, the RK4 trajectories run in parallel over all
+    cores (``prange``). All trajectories must then share one ``drag_fn``,
+    which must be None or compiled with ``numba.cfunc(drag_sig)`` or
+    ``@numba.njit``; a plain Python drag model raises TypeError. With
+    ``method="auto"`` and no drag, the closed-form solution is evaluated
+    for all trajectories at once with broadcast NumPy operations instead.
 
-        ti = t[i]
+    Parameters
+    ----------
+    params_list : sequence of RocketParams
+        Parameters of each trajectory.
+    h0s, v0s, m0s : float or array_like, shape (n_traj,)
+        Initial altitude [m], velocity [m/s] and mass [kg] of each
+        trajectory. Scalars are broadcast to all trajectories.
+    t0, t_end, dt : float
+        Common time grid, as in ``integrate_vertical_rocket``.
+    method : {"auto", "rk4"}
+        As in ``integrate_vertical_rocket``.
+    dtype : np.float32 or np.float64
+        Floating-point type of the result.
 
-        k1 = rocket_rhs(ti, y, params)
-        k2 = rocket_rhs(ti + 0.5 * dt, y + 0.5 * dt * k1, params)
-        k3 = rocket_rhs(ti + 0.5 * dt, y + 0.5 * dt * k2, params)
-        k4 = rocket_rhs(ti + dt, y + dt * k3, params)
+    Returns
+    -------
+    ndarray, shape (n_traj, 3, n_steps)
+        out[k, 0], out[k, 1], out[k, 2] are the h, v, m profiles of
+        trajectory k at the times t0 + arange(n_steps) * dt.
+
+    Raises
+    ------
+    ValueError
+        If the trajectories do not share the same ``drag_fn``.
+    TypeError
+        If Numba is installed and ``drag_fn`` is a plain Python callable.
+    """
+    if method not in ("auto", "rk4"):
+        raise ValueError(f"Unknown method {method!r}; use 'auto' or 'rk4'.")
+    dtype = _check_dtype(dtype)
+    t = _time_grid(t0, t_end, dt, dtype)
+
+    n_traj = len(params_list)
+    drag_fn = params_list[0].drag_fn if n_traj else None
+    if any(p.drag_fn is not drag_fn for p in params_list):
+        raise ValueError("All trajectories in a batch must share one drag_fn.")
+    compiled_drag = None if drag_fn is None else _compiled_drag(drag_fn)
+    if drag_fn is not None and njit is not None and compiled_drag is None:
+        raise TypeError(
+            "integrate_batch needs a drag_fn compiled with "
+            "numba.cfunc(drag_sig) or @numba.njit."
+        )
+
+    out = np.empty((n_traj, 3, t.shape[0]), dtype=dtype)
+    inputs = _batch_inputs(params_list, h0s, v0s, m0s, t)
+
+    if drag_fn is None and method == "auto":
+        # Blocks of trajectories keep the float64 temporaries in cache.
+        block = max(1, _CLOSED_FORM_BLOCK // t.shape[0])
+        for k in range(0, n_traj, block):
+            rows = slice(k, k + block)
+            _closed_form_nodrag(
+                out[rows], t, *(x[rows] for x in inputs[1:])
+            )
+    elif njit is None:
+        h0s, v0s, m0s = inputs[1:4]
+        for k, params in enumerate(params_list):
+            _integrate_into(
+                out[k], t, dt, h0s[k], v0s[k], m0s[k], params, method
+            )
+    else:
+        _rk4_batch(out, compiled_drag, t[0], out.dtype.type(dt), *inputs)
+
+    return out
+
+
+def integrate_batch_gpu(
+    params_list: Sequence[RocketParams],
+    h0s: ArrayLike,
+    v0s: ArrayLike,
+    m0s: ArrayLike,
+    t0: float,
+    t_end: float,
+    dt: float,
+    dtype: DTypeLike = np.float32,
+    threads_per_block: int = 128,
+) -> np.ndarray:
+    """
+    Integrate many no-drag trajectories with RK4 on a CUDA GPU.
+
+    Same inputs and output layout as ``integrate_batch``, for very large
+    dispersion studies (1e5+ trajectories). Each GPU thread integrates
+    one trajectory. Requires Numba with a working CUDA setup. Drag is
+    not supported: every ``params.drag_fn`` must be None.
+
+    Parameters
+    ----------
+    params_list, h0s, v0s, m0s, t0, t_end, dt, dtype
+        As in ``integrate_batch``.
+    threads_per_block : int
+        CUDA block size.
+
+    Returns
+    -------
+    ndarray, shape (n_traj, 3, n_steps)
+        h, v, m profiles of each trajectory, copied back to the host.
+
+    Raises
+    ------
+    ValueError
+        If any trajectory has a drag model.
+    RuntimeError
+        If Numba or a CUDA device is not available.
+    """
+    dtype = _check_dtype(dtype)
+    t = _time_grid(t0, t_end, dt, dtype)
+    if any(p.drag_fn is not None for p in params_list):
+        raise ValueError("integrate_batch_gpu does not support drag_fn.")
+    if njit is None:
+        raise RuntimeError("integrate_batch_gpu requires Numba.")
+
+    from numba import cuda
+
+    if not cuda.is_available():
+        raise RuntimeError("No CUDA device is available.")
+
+    # Imported here: numba.cuda is slow to import and compiling the
+    # kernel needs a CUDA toolkit.
+    from ._cuda import rk4_nodrag_kernel
+
+    n_traj = len(params_list)
+    i_burns, h0s, v0s, m0s, T_arr, g_arr, mdot_arr = _batch_inputs(
+        params_list, h0s, v0s, m0s, t
+    )
+
+    out = cuda.device_array((n_traj, 3, t.shape[0]), dtype=dtype)
+    blocks = (n_traj + threads_per_block - 1) // threads_per_block
+    if blocks:
+        rk4_nodrag_kernel[blocks, threads_per_block](
+            cuda.to_device(T_arr),
+            cuda.to_device(g_arr),
+            cuda.to_device(mdot_arr),
+            cuda.to_device(h0s),
+            cuda.to_device(v0s),
+            cuda.to_device(m0s),
+            cuda.to_device(i_burns),
+            cuda.to_device(t - t[0]),
+            dtype.type(dt),
+            dtype.type(0.5 * dt),
+            dtype.type(dt / 6.0),
+            out,
+        )
+
+    return out.copy_to_host()
+
+
+# Dormand–Prince 5(4) tableau (7 stages, FSAL).
+_DP_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_DP_A = np.array(
+    [
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [1 / 5, 0.0, 0.0, 0.0, 0.0, 0.0],
+        [3 / 40, 9 / 40, 0.0, 0.0, 0.0, 0.0],
+        [44 / 45, -56 / 15, 32 / 9, 0.0, 0.0, 0.0],
+        [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0.0, 0.0],
+        [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656, 0.0],
+        [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+    ]
+)
+# 5th-order weights (equal to the last row of A).
+_DP_B = _DP_A[6]
+# Difference between 5th- and embedded 4th-order weights.
+_DP_E = np.array(
+    [
+        71 / 57600,
+        0.0,
+        -71 / 16695,
+        71 / 1920,
+        -17253 / 339200,
+        22 / 525,
+        -1 / 40,
+    ]
+)
+# Dense output: y(t + x*dt) = y + dt * K.T @ _DP_P @ [x, x^2, x^3, x^4].
+_DP_P = np.array(
+    [
+        [
+            1.0,
+            -8048581381 / 2820520608,
+            8663915743 / 2820520608,
+            -12715105075 / 11282082432,
+        ],
+        [0.0, 0.0, 0.0, 0.0],
+        [
+            0.0,
+            131558114200 / 32700410799,
+            -68118460800 / 10900136933,
+            87487479700 / 32700410799,
+        ],
+        [
+            0.0,
+            -1754552775 / 470086768,
+            14199869525 / 1410260304,
+            -10690763975 / 1880347072,
+        ],
+        [
+            0.0,
+            127303824393 / 49829197408,
+            -318862633887 / 49829197408,
+            701980252875 / 199316789632,
+        ],
+        [
+            0.0,
+            -282668133 / 205662961,
+            2019193451 / 616988883,
+            -1453857185 / 822651844,
+        ],
+        [
+            0.0,
+            40617522 / 29380423,
+            -110615467 / 29380423,
+            69997945 / 29380423,
+        ],
+    ]
+)
+
+
+def integrate_vertical_rocket_adaptive(
+    t0: float,
+    t_end: float,
+    dt: float,
+    h0: float,
+    v0: float,
+    m0: float,
+    params: RocketParams,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> TrajectoryResult:
+    """
+    Integrate the 1D vertical rocket model with adaptive Dormand–Prince 5(4).
+
+    The internal step size is chosen from the embedded 4th-order error
+    estimate, so smooth phases are crossed in a few large steps. The
+    solution is then sampled on the same uniform grid as
+    ``integrate_vertical_rocket`` using the Dormand–Prince dense output.
+
+    Parameters
+    ----------
+    t0 : float
+        Initial time [s].
+    t_end : float
+        Final time [s]. Must satisfy t_end > t0.
+    dt : float
+        Spacing of the output samples [s]. Must be positive. It is also
+        used as the first trial step.
+    h0 : float
+        Initial altitude [m].
+    v0 : float
+        Initial vertical velocity [m/s].
+    m0 : float
+        Initial mass [kg].
+    params : RocketParams
+        Numeric parameters for the rocket.
+    rtol, atol : float
+        Relative and absolute tolerances of the local error estimate.
+
+    Returns
+    -------
+    TrajectoryResult
+        As for ``integrate_vertical_rocket``. Samples at or after
+        mass depletion are frozen (h constant, v = 0, m = 0).
+    """
+    if rtol <= 0.0 or atol <= 0.0:
+        raise ValueError("rtol and atol must be positive.")
+
+    t = _time_grid(t0, t_end, dt)
+    n_steps = t.shape[0]
+
+    y_out = np.zeros((3, n_steps))
+    h, v, m = y_out
+
+    # Mass decreases linearly, so burnout time is known in advance. Only
+    # samples strictly before it are integrated (1/m blows up at burnout).
+    n_live = max(1, _burnout_index(t, m0, params.mdot))
+
+    def rhs(tk: float, yk: np.ndarray) -> np.ndarray:
+        return np.array(rocket_rhs(tk, yk, params))
+
+    y = np.array([h0, v0, m0], dtype=float)
+    y_out[:, 0] = y
+
+    t_stop = t[n_live - 1]
+    tk = float(t0)
+    step = min(float(dt), t_stop - tk)
+    K = np.empty((7, 3))
+    K[0] = rhs(tk, y)
+    i_next = 1
+
+    while i_next < n_live:
+        if step < 10.0 * np.finfo(float).eps * max(1.0, abs(tk)):
+            raise RuntimeError(f"Step size underflow at t = {tk:.6g} s.")
+
+        for s in range(1, 7):
+            K[s] = rhs(tk + _DP_C[s] * step, y + step * (_DP_A[s, :s] @ K[:s]))
+
+        y_new = y + step * (_DP_B @ K[:6])
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err = np.sqrt(np.mean((step * (_DP_E @ K) / scale) ** 2))
+
+        if err <= 1.0:
+            # Land exactly on t_stop to avoid a roundoff-sized final step.
+            t_new = t_stop if step >= t_stop - tk else tk + step
+
+            # Fill the output samples inside (tk, t_new] by dense output.
+            i_last = min(n_live, int(np.searchsorted(t, t_new, side="right")))
+            if i_last > i_next:
+                x = (t[i_next:i_last] - tk) / step
+                powers = np.cumprod(np.tile(x, (4, 1)), axis=0)
+                y_dense = y[:, None] + step * (K.T @ _DP_P) @ powers
+                y_out[:, i_next:i_last] = y_dense
+                i_next = i_last
+
+            tk = t_new
+            y = y_new
+            K[0] = K[6]
+
+            factor = 5.0 if err == 0.0 else min(5.0, max(0.1, 0.9 * err**-0.2))
+        else:
+            factor = max(0.1, 0.9 * err**-0.2)
+
+        step = min(step * factor, t_stop - tk)
+
+    # Freeze the state after burnout, as in the fixed-step integrator.
+    h[n_live:] = h[n_live - 1]
+
+    return TrajectoryResult(t, h, v, m)
+
+
+def integrate_vertical_rocket_lsoda(
+    t0: float,
+    t_end: float,
+    dt: float,
+    h0: float,
+    v0: float,
+    m0: float,
+    params: RocketParams,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+) -> TrajectoryResult:
+    """
+    Integrate the 1D vertical rocket model with LSODA (numbalsoda).
+
+    A reference integrator with automatic stiff/non-stiff switching. The
+    right-hand side is compiled as a ``numba.cfunc`` and called from the
+    LSODA C code through its address, so no step goes through Python.
+    Requires Numba and the optional ``numbalsoda`` package.
+
+    Parameters
+    ----------
+    t0, t_end, dt, h0, v0, m0, params
+        As in ``integrate_vertical_rocket_adaptive``. ``params.drag_fn``
+        must be None or compiled with ``numba.cfunc(drag_sig)`` or
+        ``@numba.njit``.
+    rtol, atol : float
+        Relative and absolute tolerances passed to LSODA.
+
+    Returns
+    -------
+    TrajectoryResult
+        As for ``integrate_vertical_rocket``. Samples at or after
+        mass depletion are frozen (h constant, v = 0, m = 0).
+
+    Raises
+    ------
+    RuntimeError
+        If Numba or numbalsoda is not installed, or LSODA fails or
+        returns non-finite values.
+    TypeError
+        If ``drag_fn`` is a plain Python callable.
+    """
+    if rtol <= 0.0 or atol <= 0.0:
+        raise ValueError("rtol and atol must be positive.")
+    if njit is None:
+        raise RuntimeError("integrate_vertical_rocket_lsoda requires Numba.")
+    drag_fn = params.drag_fn
+    if drag_fn is not None and _compiled_drag(drag_fn) is None:
+        raise TypeError(
+            "integrate_vertical_rocket_lsoda needs a drag_fn compiled with "
+            "numba.cfunc(drag_sig) or @numba.njit."
+        )
+    try:
+        from numbalsoda import lsoda
+    except ImportError:
+        raise RuntimeError(
+            "integrate_vertical_rocket_lsoda requires numbalsoda "
+            "(pip install numbalsoda)."
+        ) from None
+
+    # Imported here: compiling the cfunc RHS needs numbalsoda's signature.
+    from ._lsoda import rhs_cfunc
+
+    t = _time_grid(t0, t_end, dt)
+    n_steps = t.shape[0]
+
+    y = np.zeros((3, n_steps))
+    h, v, m = y
+    y[:, 0] = (h0, v0, m0)
 
-        y_next = y + (dt / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+    # As in the adaptive integrator, only samples before burnout are
+    # integrated; later ones are frozen.
+    n_live = max(1, _burnout_index(t, m0, params.mdot))
+    if n_live > 1:
+        usol, success = lsoda(
+            rhs_cfunc(drag_fn).address,
+            np.array([h0, v0, m0], dtype=np.float64),
+            t[:n_live],
+            data=np.array([params.T, params.g, params.mdot], dtype=np.float64),
+            rtol=rtol,
+            atol=atol,
+        )
+        # LSODA can report success while returning inf/NaN samples.
+        if not success or not np.all(np.isfinite(usol)):
+            raise RuntimeError("LSODA integration failed.")
+        y[:, :n_live] = usol.T
 
-        h[i + 1], v[i + 1], m[i + 1] = y_next
+    h[n_live:] = h[n_live - 1]
 
-    return {"t": t, "h": h, "v": v, "m": m}
+    return TrajectoryResult(t, h, v, m)
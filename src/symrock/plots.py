@@ -7,10 +7,40 @@ These helpers are intentionally simple and rely only on Matplotlib.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+
+
+def _get_axes(ax: Optional[Axes]) -> Axes:
+    """Return ax, or the axis of a new figure if ax is None."""
+    if ax is None:
+        _, ax = plt.subplots()
+    return ax
+
+
+def _downsample(
+    max_points: Optional[int], t: np.ndarray, *ys: np.ndarray
+) -> Tuple[np.ndarray, ...]:
+    """
+    Stride t and ys down to at most about max_points samples.
+
+    The last sample is always kept so the curve ends where the data does.
+    Nothing is done if max_points is None or the data is already short.
+    """
+    n = len(t)
+    if max_points is None or n <= max_points:
+        return (t, *ys)
+    if max_points < 2:
+        raise ValueError("downsample must be at least 2 (or None).")
+
+    stride = -(-n // max_points)  # ceil(n / max_points)
+    idx = np.arange(0, n, stride)
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return tuple(np.asarray(a)[idx] for a in (t, *ys))
 
 
 def plot_altitude(
@@ -19,17 +49,35 @@ def plot_altitude(
     title: str = "Vertical trajectory",
     xlabel: str = "Time [s]",
     ylabel: str = "Altitude [m]",
+    *,
+    ax: Optional[Axes] = None,
+    line_kwargs: Optional[Dict[str, Any]] = None,
+    downsample: Optional[int] = 5000,
 ):
     """
     Plot altitude vs time.
 
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes, optional
+        Axis to draw on. By default a new figure is created; pass an
+        existing axis to overlay many trajectories without the cost of
+        a new figure per call.
+    line_kwargs : dict, optional
+        Extra keyword arguments passed to ``ax.plot`` (color, alpha, ...).
+    downsample : int or None, default 5000
+        Longer series are strided down to about this many points before
+        plotting (the screen cannot show more, and Matplotlib's render
+        time grows with the point count). None plots every sample.
+
     Returns
     -------
     matplotlib.axes.Axes
         The axis with the plotted data.
     """
-    fig, ax = plt.subplots()
-    ax.plot(t, h)
+    t, h = _downsample(downsample, t, h)
+    ax = _get_axes(ax)
+    ax.plot(t, h, **(line_kwargs or {}))
     ax.set_title(title)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
@@ -43,17 +91,35 @@ def plot_velocity(
     title: str = "Velocity profile",
     xlabel: str = "Time [s]",
     ylabel: str = "Vertical velocity [m/s]",
+    *,
+    ax: Optional[Axes] = None,
+    line_kwargs: Optional[Dict[str, Any]] = None,
+    downsample: Optional[int] = 5000,
 ):
     """
     Plot vertical velocity vs time.
 
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes, optional
+        Axis to draw on. By default a new figure is created; pass an
+        existing axis to overlay many trajectories without the cost of
+        a new figure per call.
+    line_kwargs : dict, optional
+        Extra keyword arguments passed to ``ax.plot`` (color, alpha, ...).
+    downsample : int or None, default 5000
+        Longer series are strided down to about this many points before
+        plotting (the screen cannot show more, and Matplotlib's render
+        time grows with the point count). None plots every sample.
+
     Returns
     -------
     matplotlib.axes.Axes
         The axis with the plotted data.
     """
-    fig, ax = plt.subplots()
-    ax.plot(t, v)
+    t, v = _downsample(downsample, t, v)
+    ax = _get_axes(ax)
+    ax.plot(t, v, **(line_kwargs or {}))
     ax.set_title(title)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
@@ -70,19 +136,39 @@ def plot_altitude_and_velocity(
     altitude_label: str = "Altitude [m]",
     velocity_label: str = "Vertical velocity [m/s]",
     legend_loc: str = "best",
+    *,
+    ax: Optional[Axes] = None,
+    line_kwargs: Optional[Dict[str, Any]] = None,
+    downsample: Optional[int] = 5000,
 ):
     """
     Plot altitude and vertical velocity on the same figure
     (two curves with a shared time axis).
 
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes, optional
+        Axis to draw on. By default a new figure is created; pass an
+        existing axis to overlay many trajectories without the cost of
+        a new figure per call.
+    line_kwargs : dict, optional
+        Extra keyword arguments passed to ``ax.plot`` (color, alpha, ...)
+        for both curves; a "label" entry overrides the default labels.
+    downsample : int or None, default 5000
+        Longer series are strided down to about this many points before
+        plotting (the screen cannot show more, and Matplotlib's render
+        time grows with the point count). None plots every sample.
+
     Returns
     -------
     matplotlib.axes.Axes
         The axis with the plotted data.
     """
-    fig, ax = plt.subplots()
-    ax.plot(t, h, label=altitude_label)
-    ax.plot(t, v, label=velocity_label)
+    t, h, v = _downsample(downsample, t, h, v)
+    ax = _get_axes(ax)
+    line_kwargs = line_kwargs or {}
+    ax.plot(t, h, **{"label": altitude_label, **line_kwargs})
+    ax.plot(t, v, **{"label": velocity_label, **line_kwargs})
     ax.set_title(title)
     ax.set_xlabel(xlabel)
     ax.set_ylabel("Value")
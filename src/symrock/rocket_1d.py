@@ -14,8 +14,10 @@ not a full-flight simulation.
 
 from __future__ import annotations
 
+import functools
+import math
 from dataclasses import dataclass
-from typing import Dict
+from typing import Callable, Dict
 
 import sympy as sp
 
@@ -35,6 +37,20 @@ D = sp.Function("D")(t)                 # generic drag term D(t) ≥ 0
 mdot = sp.symbols("mdot", positive=True)  # mass flow rate (|dm/dt|)
 
 
+@functools.lru_cache(maxsize=1)
+def _build_vertical_rocket_equations() -> Dict[str, sp.Eq]:
+    """Build the equations once; see vertical_rocket_equations()."""
+    h_dot = sp.diff(h, t)
+    v_dot = sp.diff(v, t)
+    m_dot = sp.diff(m, t)
+
+    eq_h = sp.Eq(h_dot, v)
+    eq_v = sp.Eq(v_dot, (T - D - m * g) / m)
+    eq_m = sp.Eq(m_dot, -mdot)
+
+    return {"h_dot": eq_h, "v_dot": eq_v, "m_dot": eq_m}
+
+
 def vertical_rocket_equations() -> Dict[str, sp.Eq]:
     """
     Return the symbolic 1D vertical rocket equations as SymPy Eq objects.
@@ -61,16 +77,34 @@ def vertical_rocket_equations() -> Dict[str, sp.Eq]:
           "v_dot":  Eq(dv/dt, (T - D(t) - m*g) / m),
           "m_dot":  Eq(dm/dt, -mdot),
         }
+
+    The SymPy objects are built once and cached; each call returns a
+    new dict, so callers may modify it freely.
     """
-    h_dot = sp.diff(h, t)
-    v_dot = sp.diff(v, t)
-    m_dot = sp.diff(m, t)
+    return dict(_build_vertical_rocket_equations())
 
-    eq_h = sp.Eq(h_dot, v)
-    eq_v = sp.Eq(v_dot, (T - D - m * g) / m)
-    eq_m = sp.Eq(m_dot, -mdot)
 
-    return {"h_dot": eq_h, "v_dot": eq_v, "m_dot": eq_m}
+@functools.lru_cache(maxsize=1)
+def vertical_rocket_rhs_numeric() -> Callable:
+    """
+    Numeric right-hand side generated from the symbolic equations.
+
+    The right-hand sides of vertical_rocket_equations() are turned into
+    a NumPy function with sp.lambdify (with common subexpression
+    elimination). It is generated on the first call and cached.
+
+    Returns
+    -------
+    callable
+        f(t, h, v, m, T, g, mdot, D) -> [dh/dt, dv/dt, dm/dt].
+        Arguments may be floats or NumPy arrays (evaluated elementwise),
+        and D is the drag value at that point.
+    """
+    eqs = _build_vertical_rocket_equations()
+    rhs = [eqs["h_dot"].rhs, eqs["v_dot"].rhs, eqs["m_dot"].rhs]
+    return sp.lambdify(
+        (t, h, v, m, T, g, mdot, D), rhs, modules="numpy", cse=True
+    )
 
 
 def tsiolkovsky_delta_v(Isp: sp.Symbol | float,
@@ -89,7 +123,10 @@ def tsiolkovsky_delta_v(Isp: sp.Symbol | float,
         mf  — final mass  (dry mass).
 
     The function returns a SymPy expression that can be evaluated
-    numerically via .subs(...) or sp.N(...).
+    numerically via .subs(...) or sp.N(...). When every argument is a
+    plain number and at least one is a float, Δv is computed with
+    math.log and returned as a sp.Float, skipping the symbolic build;
+    all-integer inputs keep the exact symbolic form.
 
     Parameters
     ----------
@@ -107,6 +144,11 @@ def tsiolkovsky_delta_v(Isp: sp.Symbol | float,
     sympy.Expr
         Δv expression Isp * g0 * log(m0 / mf).
     """
+    args = (Isp, g0, m0, mf)
+    if (all(type(x) in (int, float) for x in args)
+            and any(type(x) is float for x in args)):
+        return sp.Float(Isp * g0 * math.log(m0 / mf))
+
     Isp_sym = sp.sympify(Isp)
     g0_sym = sp.sympify(g0)
     m0_sym = sp.sympify(m0)
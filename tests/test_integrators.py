@@ -0,0 +1,659 @@
+"""
+Tests for the numeric RK4 integrator of the 1D vertical rocket.
+
+We check:
+- the no-drag trajectory (exact and RK4) against the closed-form solution;
+- that the compiled and interpreted loops agree when drag is present;
+- mass depletion (state is frozen once m <= 0);
+- the adaptive Dormand–Prince integrator and its dense output;
+- the LSODA reference integrator (optional numbalsoda);
+- float32 mode and batched integration of many trajectories.
+"""
+
+import dataclasses
+import sys
+import warnings
+
+import numpy as np
+import pytest
+
+from symrock.integrators import (
+    RocketParams,
+    TrajectoryResult,
+    integrate_batch,
+    integrate_batch_gpu,
+    integrate_vertical_rocket,
+    integrate_vertical_rocket_adaptive,
+    integrate_vertical_rocket_lsoda,
+    rocket_rhs,
+)
+
+
+T_VAL = 15000.0
+G_VAL = 9.80665
+MDOT_VAL = 5.0
+M0_VAL = 500.0
+
+
+def _exact_no_drag(t, v0=0.0, h0=0.0):
+    """Closed-form h(t), v(t) for constant thrust and mass flow, no drag."""
+    m_t = M0_VAL - MDOT_VAL * t
+    ratio = np.log(M0_VAL / m_t)
+    v_t = v0 - G_VAL * t + (T_VAL / MDOT_VAL) * ratio
+    h_t = (
+        h0
+        + v0 * t
+        - 0.5 * G_VAL * t**2
+        + (T_VAL / MDOT_VAL) * (t - (m_t / MDOT_VAL) * ratio)
+    )
+    return h_t, v_t, m_t
+
+
+def test_rocket_rhs_returns_scalar_tuple():
+    """rocket_rhs returns (dh/dt, dv/dt, dm/dt) and freezes at m <= 0."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+
+    dhdt, dvdt, dmdt = rocket_rhs(0.0, (10.0, 20.0, M0_VAL), params)
+    assert dhdt == 20.0
+    assert np.isclose(dvdt, T_VAL / M0_VAL - G_VAL)
+    assert dmdt == -MDOT_VAL
+
+    assert rocket_rhs(0.0, (10.0, 20.0, 0.0), params) == (0.0, 0.0, 0.0)
+
+
+def test_rocket_params_is_frozen():
+    """RocketParams is immutable and slotted (Python >= 3.10)."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        params.T = 0.0
+    assert dataclasses.replace(params, T=0.0).T == 0.0
+    if sys.version_info >= (3, 10):
+        assert not hasattr(params, "__dict__")
+
+
+@pytest.mark.parametrize("method", ["auto", "rk4"])
+def test_integrate_no_drag_matches_closed_form(method):
+    """The exact and the RK4 no-drag paths follow the analytic trajectory."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    res = integrate_vertical_rocket(
+        0.0, 60.0, 0.1, 0.0, 0.0, M0_VAL, params, method=method
+    )
+
+    h_t, v_t, m_t = _exact_no_drag(res["t"])
+
+    assert np.allclose(res["m"], m_t, rtol=1e-12, atol=1e-9)
+    assert np.allclose(res["v"], v_t, rtol=1e-8, atol=1e-6)
+    assert np.allclose(res["h"], h_t, rtol=1e-8, atol=1e-6)
+
+
+def test_integrate_with_jitted_drag_matches_python_drag():
+    """A Numba-compiled drag model gives the same result as a Python one."""
+    numba = pytest.importorskip("numba")
+
+    def drag_py(t, h, v, m):
+        return 0.5 * v * abs(v)
+
+    drag_jit = numba.njit(drag_py)
+
+    kwargs = dict(t0=0.0, t_end=30.0, dt=0.05, h0=0.0, v0=0.0, m0=M0_VAL)
+    res_py = integrate_vertical_rocket(
+        params=RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_py),
+        **kwargs,
+    )
+    res_jit = integrate_vertical_rocket(
+        params=RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_jit),
+        **kwargs,
+    )
+
+    for key in ("h", "v", "m"):
+        assert np.allclose(res_py[key], res_jit[key], rtol=1e-10, atol=1e-8)
+
+
+def test_integrate_returns_trajectory_result():
+    """Results expose t, h, v, m as attributes, by name and as a dict."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    res = integrate_vertical_rocket(0.0, 10.0, 0.5, 0.0, 0.0, M0_VAL, params)
+
+    assert isinstance(res, TrajectoryResult)
+    assert res["h"] is res.h
+    as_dict = res.as_dict()
+    assert list(as_dict) == ["t", "h", "v", "m"]
+    assert all(as_dict[key] is getattr(res, key) for key in as_dict)
+    with pytest.raises(KeyError):
+        res["x"]
+
+    # Read-only mapping protocol, as for the earlier dict results.
+    assert "h" in res and "x" not in res
+    assert list(res) == list(res.keys()) == ["t", "h", "v", "m"]
+    assert len(res) == 4
+    assert all(dict(res)[key] is getattr(res, key) for key in res)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        res.h = res.v
+
+
+def test_integrate_profiles_share_one_buffer():
+    """h, v, m are row views of a single contiguous (3, n) array."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    for method in ("auto", "rk4"):
+        res = integrate_vertical_rocket(
+            0.0, 1.0, 0.1, 0.0, 0.0, M0_VAL, params, method=method
+        )
+        buf = res["h"].base
+        assert buf is not None and buf.shape == (3, 11)
+        assert buf.flags.c_contiguous
+        assert res["v"].base is buf and res["m"].base is buf
+
+
+def test_integrate_constant_mass_is_uniform_acceleration():
+    """With mdot = 0 the no-drag solution is a parabola in h."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=0.0)
+    res = integrate_vertical_rocket(0.0, 10.0, 0.5, 1.0, 2.0, M0_VAL, params)
+
+    a = T_VAL / M0_VAL - G_VAL
+    tt = res["t"]
+    assert np.allclose(res["m"], M0_VAL)
+    assert np.allclose(res["v"], 2.0 + a * tt)
+    assert np.allclose(res["h"], 1.0 + 2.0 * tt + 0.5 * a * tt**2)
+
+
+def test_integrate_with_cfunc_drag_matches_python_drag():
+    """A numba.cfunc drag model (C function pointer) gives the same result."""
+    numba = pytest.importorskip("numba")
+    from symrock.integrators import drag_sig
+
+    def drag_py(t, h, v, m):
+        return 0.5 * v * abs(v)
+
+    drag_c = numba.cfunc(drag_sig)(drag_py)
+
+    kwargs = dict(t0=0.0, t_end=30.0, dt=0.05, h0=0.0, v0=0.0, m0=M0_VAL)
+    res_py = integrate_vertical_rocket(
+        params=RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_py),
+        **kwargs,
+    )
+    res_c = integrate_vertical_rocket(
+        params=RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_c),
+        **kwargs,
+    )
+
+    for key in ("h", "v", "m"):
+        assert np.allclose(res_py[key], res_c[key], rtol=1e-10, atol=1e-8)
+
+
+@pytest.mark.parametrize("with_drag", [False, True])
+def test_cython_rk4_matches_python_loop(with_drag):
+    """The optional Cython loop reproduces the uncompiled Python loops."""
+    rk4_ext = pytest.importorskip("symrock._rk4")
+    from symrock.integrators import _rk4_drag, _rk4_nodrag
+
+    def drag(t, h, v, m):
+        return 1e-3 * v * abs(v)
+
+    # 241 nodes at dt = 0.5 s; mass runs out at node 200.
+    args = (0.0, 0.5, 200, 0.0, 0.0, M0_VAL, T_VAL, G_VAL, MDOT_VAL)
+    expected = np.empty((3, 241))
+    if with_drag:
+        getattr(_rk4_drag, "py_func", _rk4_drag)(drag, expected, *args)
+    else:
+        getattr(_rk4_nodrag, "py_func", _rk4_nodrag)(expected, *args)
+
+    result = np.empty((3, 241))
+    rk4_ext.integrate_rk4_c(result, *args, drag if with_drag else None)
+
+    assert np.allclose(result, expected, rtol=1e-12, atol=1e-9)
+
+
+# Burnout exactly on node 76 (t = 53.2 s), which is not exact in floating
+# point: t[76] = 53.199999999999996 < 266/5, yet the mass there is 0.
+ON_NODE = dict(t0=0.0, t_end=60.0, dt=0.7, h0=0.0, v0=0.0, m0=266.0)
+ON_NODE_PARAMS = RocketParams(T=1000.0, g=9.8, mdot=5.0)
+
+
+@pytest.mark.parametrize("method", ["auto", "rk4"])
+def test_integrate_freezes_state_after_burnout(method):
+    """Once the mass is exhausted, h stays constant and v, m drop to 0."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    res = integrate_vertical_rocket(
+        0.0, 120.0, 0.5, 0.0, 0.0, M0_VAL, params, method=method
+    )
+
+    burned = res["t"] >= M0_VAL / MDOT_VAL
+    assert burned.any()
+    assert np.all(res["m"][burned] == 0.0)
+    assert np.all(res["v"][burned] == 0.0)
+    assert np.all(np.isfinite(res["h"]))
+
+    # h is held at its value from the last node before burnout.
+    i_burn = int(np.argmax(burned))
+    h_last, _, _ = _exact_no_drag(res["t"][i_burn - 1])
+    assert np.all(res["h"][burned] == res["h"][i_burn - 1])
+    assert np.isclose(res["h"][i_burn - 1], h_last, rtol=1e-4)
+
+    # Burnout on a node: that node is the first frozen one.
+    res = integrate_vertical_rocket(
+        params=ON_NODE_PARAMS, method=method, **ON_NODE
+    )
+    assert np.all(np.isfinite(res["h"])) and res["m"][75] > 0.0
+    assert np.all(res["m"][76:] == 0.0) and np.all(res["v"][76:] == 0.0)
+    assert np.all(res["h"][76:] == res["h"][75])
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("method", ["auto", "rk4"])
+def test_burnout_on_grid_node_is_frozen(method, dtype):
+    """A node whose mass is exactly 0 is frozen despite time rounding."""
+    res = integrate_vertical_rocket(
+        params=ON_NODE_PARAMS, method=method, dtype=dtype, **ON_NODE
+    )
+    out = integrate_batch(
+        [ON_NODE_PARAMS] * 2, 0.0, 0.0, 266.0, 0.0, 60.0, 0.7,
+        method=method, dtype=dtype,
+    )
+
+    for h, v, m in ((res.h, res.v, res.m), *out):
+        assert np.all(np.isfinite(h)) and np.all(np.isfinite(v))
+        assert np.all(v[76:] == 0.0) and np.all(m[76:] == 0.0)
+        assert np.all(h[76:] == h[75])
+        assert np.all(m[:76] > 0.0)
+
+
+@pytest.mark.parametrize("method", ["auto", "rk4"])
+@pytest.mark.parametrize("m0", [0.0, -1.0])
+@pytest.mark.parametrize("mdot", [MDOT_VAL, 0.0])
+def test_integrate_without_initial_mass_is_frozen(method, m0, mdot):
+    """With m0 <= 0 the initial state is kept at t0 and frozen afterwards."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=mdot)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = integrate_vertical_rocket(
+            0.0, 5.0, 0.5, 10.0, 3.0, m0, params, method=method
+        )
+
+    assert (res["h"][0], res["v"][0], res["m"][0]) == (10.0, 3.0, m0)
+    assert np.all(res["h"] == 10.0)
+    assert np.all(res["v"][1:] == 0.0)
+    assert np.all(res["m"][1:] == 0.0)
+
+
+def test_adaptive_no_drag_matches_closed_form():
+    """Dense output of the adaptive integrator follows the exact solution."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    res = integrate_vertical_rocket_adaptive(
+        0.0, 60.0, 0.1, 0.0, 0.0, M0_VAL, params, rtol=1e-8, atol=1e-10
+    )
+
+    h_t, v_t, m_t = _exact_no_drag(res["t"])
+
+    assert res["t"].shape == (601,)
+    assert np.allclose(res["m"], m_t, rtol=1e-10, atol=1e-9)
+    assert np.allclose(res["v"], v_t, rtol=1e-6, atol=1e-6)
+    assert np.allclose(res["h"], h_t, rtol=1e-6, atol=1e-6)
+
+
+def test_adaptive_agrees_with_rk4_with_drag_and_burnout():
+    """With drag and burnout, adaptive and fine-step RK4 results agree."""
+
+    def drag(t, h, v, m):
+        return 0.5 * v * abs(v)
+
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag)
+    kwargs = dict(t0=0.0, t_end=120.0, dt=0.5, h0=0.0, v0=0.0, m0=M0_VAL)
+
+    res_rk4 = integrate_vertical_rocket(params=params, **kwargs)
+    res_ad = integrate_vertical_rocket_adaptive(params=params, **kwargs)
+
+    # Close to burnout drag/m makes fixed-step RK4 unstable at this dt.
+    early = res_rk4["t"] < 0.9 * M0_VAL / MDOT_VAL
+    for key in ("h", "v", "m"):
+        assert np.allclose(
+            res_ad[key][early], res_rk4[key][early], rtol=1e-5, atol=1e-6
+        )
+
+    assert np.all(np.isfinite(res_ad["v"]))
+    burned = res_ad["t"] >= M0_VAL / MDOT_VAL
+    assert np.all(res_ad["m"][burned] == 0.0)
+    assert np.all(res_ad["v"][burned] == 0.0)
+    assert np.all(res_ad["h"][burned] == res_ad["h"][burned][0])
+
+
+def test_adaptive_burnout_on_grid_node():
+    """Integration stops before a node at burnout instead of underflowing."""
+    res = integrate_vertical_rocket_adaptive(
+        params=ON_NODE_PARAMS, rtol=1e-10, atol=1e-10, **ON_NODE
+    )
+    exact = integrate_vertical_rocket(params=ON_NODE_PARAMS, **ON_NODE)
+
+    assert np.all(np.isfinite(res["h"])) and np.all(np.isfinite(res["v"]))
+    assert np.all(res["m"][76:] == 0.0) and np.all(res["v"][76:] == 0.0)
+    assert np.all(res["h"][76:] == res["h"][75])
+    for key in ("h", "v", "m"):
+        assert np.allclose(res[key], exact[key], rtol=1e-5, atol=1e-6)
+
+
+def test_lsoda_matches_closed_form_and_adaptive():
+    """LSODA agrees with the exact no-drag solution and with DP5 under drag."""
+    numba = pytest.importorskip("numba")
+    pytest.importorskip("numbalsoda")
+    from symrock.integrators import drag_sig
+
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    res = integrate_vertical_rocket_lsoda(
+        0.0, 120.0, 0.5, 0.0, 0.0, M0_VAL, params, rtol=1e-10, atol=1e-10
+    )
+    live = res["t"] < M0_VAL / MDOT_VAL
+    h_t, v_t, m_t = _exact_no_drag(res["t"][live])
+    assert np.allclose(res["m"][live], m_t, rtol=1e-8, atol=1e-8)
+    assert np.allclose(res["v"][live], v_t, rtol=1e-6, atol=1e-6)
+    assert np.allclose(res["h"][live], h_t, rtol=1e-6, atol=1e-6)
+    assert np.all(res["v"][~live] == 0.0)
+    assert np.all(res["h"][~live] == res["h"][~live][0])
+
+    @numba.cfunc(drag_sig)
+    def drag(t, h, v, m):
+        return 0.5 * v * abs(v)
+
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag)
+    kwargs = dict(t0=0.0, t_end=90.0, dt=0.5, h0=0.0, v0=0.0, m0=M0_VAL)
+    res_ls = integrate_vertical_rocket_lsoda(
+        params=params, rtol=1e-10, atol=1e-10, **kwargs
+    )
+    res_ad = integrate_vertical_rocket_adaptive(
+        params=params, rtol=1e-10, atol=1e-10, **kwargs
+    )
+    for key in ("h", "v", "m"):
+        assert np.allclose(res_ls[key], res_ad[key], rtol=1e-6, atol=1e-6)
+
+
+def test_lsoda_burnout_on_grid_node(capfd):
+    """LSODA is never asked to step into a node with zero mass."""
+    pytest.importorskip("numba")
+    pytest.importorskip("numbalsoda")
+
+    res = integrate_vertical_rocket_lsoda(
+        params=ON_NODE_PARAMS, rtol=1e-10, atol=1e-10, **ON_NODE
+    )
+    exact = integrate_vertical_rocket(params=ON_NODE_PARAMS, **ON_NODE)
+
+    assert np.all(np.isfinite(res["h"])) and np.all(np.isfinite(res["v"]))
+    assert np.all(res["m"][76:] == 0.0) and np.all(res["v"][76:] == 0.0)
+    assert np.all(res["h"][76:] == res["h"][75])
+    for key in ("h", "v", "m"):
+        assert np.allclose(res[key], exact[key], rtol=1e-5, atol=1e-6)
+    # LSODA reports trouble on stderr, from C.
+    assert capfd.readouterr().err == ""
+
+
+def test_lsoda_rejects_python_drag():
+    """A plain Python drag model cannot be called from LSODA."""
+    pytest.importorskip("numba")
+
+    def drag(t, h, v, m):
+        return 0.0
+
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag)
+    with pytest.raises(TypeError):
+        integrate_vertical_rocket_lsoda(0.0, 10.0, 0.1, 0.0, 0.0, M0_VAL, params)
+
+
+def test_specialized_rk4_matches_generic_loop():
+    """RK4 loops compiled with constant T, g, mdot match the generic loop."""
+    numba = pytest.importorskip("numba")
+    from symrock.integrators import _specialized_rk4
+
+    @numba.njit
+    def drag(t, h, v, m):
+        return 0.5 * v * abs(v)
+
+    kwargs = dict(t0=0.0, t_end=60.0, dt=0.05, h0=0.0, v0=0.0, m0=M0_VAL)
+    for drag_fn in (None, drag):
+        params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_fn)
+        for dtype in (np.float64, np.float32):
+            res = integrate_vertical_rocket(
+                params=params, method="rk4", dtype=dtype, **kwargs
+            )
+            res_spec = integrate_vertical_rocket(
+                params=params, method="rk4", dtype=dtype, specialize=True,
+                **kwargs,
+            )
+            for key in ("h", "v", "m"):
+                assert res_spec[key].dtype == dtype
+                assert np.allclose(res_spec[key], res[key], rtol=1e-6)
+
+    # One compiled loop per (drag?, dtype, T, g, mdot).
+    loop = _specialized_rk4(False, "<f8", T_VAL, G_VAL, MDOT_VAL)
+    assert _specialized_rk4(False, "<f8", T_VAL, G_VAL, MDOT_VAL) is loop
+    assert _specialized_rk4(False, "<f4", T_VAL, G_VAL, MDOT_VAL) is not loop
+
+    # Frozen float32 constants keep the inlined loop in float32.
+    f32 = np.float32
+    consts = (f32(T_VAL), f32(G_VAL), f32(MDOT_VAL))
+    args = (f32(0.0), f32(0.5), 100, f32(0.0), f32(0.0), f32(M0_VAL))
+    y = np.empty((3, 101), dtype=f32)
+    _specialized_rk4(False, "<f4", *consts)(y, *args)
+    y64 = np.empty((3, 101))
+    _specialized_rk4(False, "<f8", *map(float, consts))(
+        y64, *(a if isinstance(a, int) else float(a) for a in args)
+    )
+    _assert_computed_in_float32(y, y64)
+
+
+def test_integrate_rejects_unknown_method():
+    """Only "auto" and "rk4" are accepted as methods."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    with pytest.raises(ValueError):
+        integrate_vertical_rocket(
+            0.0, 1.0, 0.1, 0.0, 0.0, M0_VAL, params, method="euler"
+        )
+
+
+@pytest.mark.parametrize("method", ["auto", "rk4"])
+def test_integrate_float32_close_to_float64(method):
+    """float32 mode returns float32 arrays close to the float64 result."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    kwargs = dict(t0=0.0, t_end=60.0, dt=0.1, h0=0.0, v0=0.0, m0=M0_VAL)
+
+    res64 = integrate_vertical_rocket(params=params, method=method, **kwargs)
+    res32 = integrate_vertical_rocket(
+        params=params, method=method, dtype=np.float32, **kwargs
+    )
+
+    for key in ("t", "h", "v", "m"):
+        assert res32[key].dtype == np.float32
+        assert np.allclose(res32[key], res64[key], rtol=1e-4, atol=1e-3)
+
+
+def test_rk4_float32_mass_does_not_drift():
+    """Over a million float32 steps the RK4 mass follows m0 - mdot*t."""
+    params = RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)
+    res = integrate_vertical_rocket(
+        0.0, 120.0, 1e-4, 0.0, 0.0, M0_VAL, params,
+        method="rk4", dtype=np.float32,
+    )
+
+    live = res["m"] > 0.0
+    m_t = M0_VAL - MDOT_VAL * res["t"][live].astype(np.float64)
+    assert np.allclose(res["m"][live], m_t, rtol=0.0, atol=1e-3)
+    assert np.all(np.isfinite(res["v"])) and np.all(res["v"][~live] == 0.0)
+
+
+def _assert_computed_in_float32(y32, y64):
+    """
+    Check that y32 was computed in float32 arithmetic, not only stored in it.
+
+    y64 is the same run in float64 with the float32-rounded inputs. A loop
+    promoted to float64 would return exactly y64 rounded to float32; a
+    float32 loop differs from it by float32 rounding only.
+    """
+    assert y32.dtype == np.float32
+    scale = np.abs(y64).max(axis=-1, keepdims=True)
+    assert np.all(np.abs(y32 - y64) <= 1e-5 * scale)
+    assert not np.array_equal(y32, y64.astype(np.float32))
+
+
+@pytest.mark.parametrize("with_drag", [False, True])
+def test_compiled_float32_loop_computes_in_float32(with_drag):
+    """Compiled for float32, the RK4 loop computes in float32."""
+    numba = pytest.importorskip("numba")
+    from symrock.integrators import _rk4_drag, _rk4_nodrag, drag_sig
+
+    f32 = np.float32
+    args = (f32(0.0), f32(0.5), 100, f32(0.0), f32(0.0), f32(M0_VAL),
+            f32(T_VAL), f32(G_VAL), f32(MDOT_VAL))
+    args64 = tuple(a if isinstance(a, int) else float(a) for a in args)
+    y = np.empty((3, 101), dtype=f32)
+    y64 = np.empty((3, 101))
+    if with_drag:
+        # float64 signature: the loop must cast the drag value back.
+        drag = numba.cfunc(drag_sig)(lambda t, h, v, m: 0.1 * v * abs(v))
+        _rk4_drag(drag.ctypes, y, *args)
+        _rk4_drag(drag.ctypes, y64, *args64)
+    else:
+        _rk4_nodrag(y, *args)
+        _rk4_nodrag(y64, *args64)
+
+    _assert_computed_in_float32(y, y64)
+
+
+@pytest.mark.parametrize("method", ["auto", "rk4"])
+def test_integrate_batch_matches_single_runs(method):
+    """Each batch row equals the corresponding single integration."""
+    params_list = [
+        RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL),
+        RocketParams(T=0.8 * T_VAL, g=G_VAL, mdot=4.0),
+        RocketParams(T=T_VAL, g=1.62, mdot=0.0),
+        RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL),
+    ]
+    m0s = [M0_VAL, 450.0, 520.0, 0.0]
+
+    out = integrate_batch(
+        params_list,
+        0.0,
+        0.0,
+        m0s,
+        0.0,
+        130.0,
+        0.1,
+        method=method,
+        dtype=np.float64,
+    )
+
+    assert out.shape == (4, 3, 1301)
+    assert out.dtype == np.float64
+    for k, (params, m0) in enumerate(zip(params_list, m0s)):
+        res = integrate_vertical_rocket(
+            0.0, 130.0, 0.1, 0.0, 0.0, m0, params, method=method
+        )
+        expected = np.stack([res["h"], res["v"], res["m"]])
+        assert np.allclose(out[k], expected, rtol=1e-12, atol=1e-9)
+
+    out32 = integrate_batch(params_list, 0.0, 0.0, m0s, 0.0, 130.0, 0.1)
+    assert out32.dtype == np.float32
+
+
+def test_integrate_batch_closed_form_in_blocks(monkeypatch):
+    """The no-drag batch is the same when evaluated in several blocks."""
+    import symrock.integrators as integrators
+
+    rng = np.random.default_rng(0)
+    params_list = [
+        RocketParams(T=T, g=G_VAL, mdot=mdot)
+        for T, mdot in zip(rng.uniform(1e4, 2e4, 7), rng.uniform(4.0, 6.0, 7))
+    ]
+    m0s = rng.uniform(300.0, 600.0, 7)
+    args = (params_list, 0.0, 0.0, m0s, 0.0, 130.0, 0.1)
+
+    whole = integrate_batch(*args, dtype=np.float64)
+    monkeypatch.setattr(integrators, "_CLOSED_FORM_BLOCK", 2 * 1301)
+    blocked = integrate_batch(*args, dtype=np.float64)
+
+    assert np.array_equal(blocked, whole)
+    for k, (params, m0) in enumerate(zip(params_list, m0s)):
+        res = integrate_vertical_rocket(0.0, 130.0, 0.1, 0.0, 0.0, m0, params)
+        expected = np.stack([res["h"], res["v"], res["m"]])
+        assert np.allclose(whole[k], expected, rtol=1e-12, atol=1e-9)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_batch_burnout_nodes_match_scalar_rule(dtype):
+    """Vectorized burnout nodes equal _burnout_index, clipped to >= 1."""
+    from symrock.integrators import _batch_inputs, _burnout_index, _time_grid
+
+    t = _time_grid(0.0, 130.0, 0.1, dtype)
+    mdots = [MDOT_VAL, 4.0, 0.0, MDOT_VAL, 0.0, -1.0, 3.0]
+    m0s = [M0_VAL, 450.0, 520.0, 0.0, -5.0, 100.0, 1e-4]
+    params_list = [RocketParams(T=T_VAL, g=G_VAL, mdot=md) for md in mdots]
+
+    i_burns = _batch_inputs(params_list, 0.0, 0.0, m0s, t)[0]
+
+    cast = t.dtype.type
+    expected = [
+        max(1, _burnout_index(t, cast(m0), cast(md)))
+        for m0, md in zip(m0s, mdots)
+    ]
+    assert i_burns.dtype == np.int64
+    assert i_burns.tolist() == expected
+
+
+def test_integrate_batch_with_compiled_drag():
+    """Batched drag runs need one shared, compiled drag model."""
+    numba = pytest.importorskip("numba")
+    from symrock.integrators import drag_sig
+
+    def drag_py(t, h, v, m):
+        return 1e-3 * v * abs(v)
+
+    drag_c = numba.cfunc(drag_sig)(drag_py)
+    params_list = [
+        RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_c),
+        RocketParams(T=0.9 * T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_c),
+    ]
+
+    out = integrate_batch(
+        params_list, 0.0, 0.0, M0_VAL, 0.0, 30.0, 0.1, dtype=np.float64
+    )
+    for k, params in enumerate(params_list):
+        res = integrate_vertical_rocket(
+            0.0, 30.0, 0.1, 0.0, 0.0, M0_VAL, params
+        )
+        expected = np.stack([res["h"], res["v"], res["m"]])
+        assert np.allclose(out[k], expected, rtol=1e-12, atol=1e-9)
+
+    py_params = [
+        RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag_py)
+    ]
+    with pytest.raises(TypeError):
+        integrate_batch(py_params, 0.0, 0.0, M0_VAL, 0.0, 30.0, 0.1)
+
+    mixed = params_list[:1] + [RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL)]
+    with pytest.raises(ValueError):
+        integrate_batch(mixed, 0.0, 0.0, M0_VAL, 0.0, 30.0, 0.1)
+
+
+def test_integrate_batch_gpu_matches_cpu():
+    """The CUDA kernel reproduces the CPU RK4 batch (needs a GPU)."""
+    cuda = pytest.importorskip("numba.cuda")
+    if not cuda.is_available():
+        pytest.skip("no CUDA device available")
+
+    params_list = [
+        RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL),
+        RocketParams(T=0.8 * T_VAL, g=G_VAL, mdot=4.0),
+    ]
+    args = (params_list, 0.0, 0.0, [M0_VAL, 450.0], 0.0, 130.0, 0.5)
+
+    out_gpu = integrate_batch_gpu(*args, dtype=np.float64)
+    out_cpu = integrate_batch(*args, method="rk4", dtype=np.float64)
+
+    assert np.allclose(out_gpu, out_cpu, rtol=1e-10, atol=1e-8)
+
+
+def test_integrate_batch_gpu_rejects_drag():
+    """Drag models are not supported by the GPU kernel."""
+
+    def drag(t, h, v, m):
+        return 0.0
+
+    params_list = [RocketParams(T=T_VAL, g=G_VAL, mdot=MDOT_VAL, drag_fn=drag)]
+    with pytest.raises(ValueError):
+        integrate_batch_gpu(params_list, 0.0, 0.0, M0_VAL, 0.0, 10.0, 0.1)
@@ -0,0 +1,103 @@
+# tests/test_plots.py
+"""
+Tests for the Matplotlib plotting helpers.
+
+We check:
+- each helper creates its own axis by default;
+- an existing axis can be passed in and reused for overlays;
+- line_kwargs are forwarded to ax.plot;
+- long series are strided down before plotting.
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from symrock.plots import (
+    plot_altitude,
+    plot_altitude_and_velocity,
+    plot_velocity,
+)
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    yield
+    plt.close("all")
+
+
+def _trajectory():
+    t = np.linspace(0.0, 10.0, 101)
+    return t, 5.0 * t**2, 10.0 * t
+
+
+def test_plot_helpers_create_new_axis_by_default():
+    t, h, v = _trajectory()
+
+    ax_h = plot_altitude(t, h)
+    ax_v = plot_velocity(t, v)
+    ax_hv = plot_altitude_and_velocity(t, h, v)
+
+    assert len({id(ax_h), id(ax_v), id(ax_hv)}) == 3
+    assert len(ax_h.lines) == 1
+    assert len(ax_v.lines) == 1
+    assert len(ax_hv.lines) == 2
+
+
+def test_plot_helpers_reuse_given_axis():
+    t, h, v = _trajectory()
+    fig, ax = plt.subplots()
+
+    for scale in (1.0, 2.0, 3.0):
+        out = plot_altitude(t, scale * h, ax=ax)
+        assert out is ax
+    plot_velocity(t, v, ax=ax)
+    plot_altitude_and_velocity(t, h, v, ax=ax)
+
+    assert len(ax.lines) == 6
+    assert len(plt.get_fignums()) == 1
+
+
+def test_plot_helpers_forward_line_kwargs():
+    t, h, v = _trajectory()
+
+    ax = plot_altitude(t, h, line_kwargs={"color": "red", "alpha": 0.3})
+    (line,) = ax.lines
+    assert line.get_color() == "red"
+    assert line.get_alpha() == 0.3
+
+    ax = plot_altitude_and_velocity(t, h, v, line_kwargs={"linewidth": 3.0})
+    assert [ln.get_linewidth() for ln in ax.lines] == [3.0, 3.0]
+    assert [ln.get_label() for ln in ax.lines] == [
+        "Altitude [m]",
+        "Vertical velocity [m/s]",
+    ]
+
+
+def test_plot_helpers_downsample_long_series():
+    t = np.linspace(0.0, 100.0, 200_001)
+    h = t**2
+
+    ax = plot_altitude(t, h)
+    (line,) = ax.lines
+    x, y = line.get_data()
+    assert len(x) <= 5001
+    assert x[0] == t[0] and x[-1] == t[-1]
+    assert np.array_equal(y, x**2)
+
+    ax = plot_altitude_and_velocity(t, h, 2.0 * t, downsample=100)
+    assert all(len(ln.get_xdata()) <= 101 for ln in ax.lines)
+
+    ax = plot_velocity(t, 2.0 * t, downsample=None)
+    assert len(ax.lines[0].get_xdata()) == len(t)
+
+
+def test_plot_helpers_keep_short_series():
+    t, h, _ = _trajectory()
+
+    ax = plot_altitude(t, h, downsample=1000)
+    assert np.array_equal(ax.lines[0].get_xdata(), t)
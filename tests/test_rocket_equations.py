@@ -4,6 +4,7 @@ Basic tests for the symbolic 1D rocket mechanics lab.
 
 We check:
 - structure of the vertical rocket equations (dh/dt, dv/dt, dm/dt);
+- the lambdified numeric RHS against the hand-written integrator RHS;
 - Tsiolkovsky Δv formula for simple numeric values.
 """
 
@@ -20,8 +21,10 @@ from symrock import (
     D,
     mdot,
     vertical_rocket_equations,
+    vertical_rocket_rhs_numeric,
     tsiolkovsky_delta_v,
 )
+from symrock.integrators import RocketParams, rocket_rhs
 
 
 def test_vertical_rocket_equations_structure():
@@ -48,6 +51,36 @@ def test_vertical_rocket_equations_structure():
     assert eq_m.rhs == -mdot
 
 
+def test_vertical_rocket_equations_cached_copy():
+    """Repeated calls reuse the SymPy objects but return separate dicts."""
+    eqs_a = vertical_rocket_equations()
+    eqs_b = vertical_rocket_equations()
+
+    assert eqs_a is not eqs_b
+    assert eqs_a["v_dot"] is eqs_b["v_dot"]
+
+    eqs_a.pop("h_dot")
+    assert "h_dot" in vertical_rocket_equations()
+
+
+def test_vertical_rocket_rhs_numeric_matches_rocket_rhs():
+    """The lambdified RHS agrees with the integrator's rocket_rhs."""
+    f = vertical_rocket_rhs_numeric()
+    assert vertical_rocket_rhs_numeric() is f
+
+    def drag(t_, h_, v_, m_):
+        return 0.3 * v_ * abs(v_)
+
+    params = RocketParams(T=15000.0, g=9.80665, mdot=5.0, drag_fn=drag)
+    state = (120.0, 45.0, 420.0)
+    D_val = drag(2.0, *state)
+
+    got = f(2.0, *state, params.T, params.g, params.mdot, D_val)
+    expected = rocket_rhs(2.0, state, params)
+
+    assert np.allclose(got, expected, rtol=1e-12, atol=1e-12)
+
+
 def test_tsiolkovsky_delta_v_numeric():
     """
     Check that Tsiolkovsky Δv matches the standard formula:
@@ -66,3 +99,19 @@ def test_tsiolkovsky_delta_v_numeric():
 
     assert np.isclose(dv_num, dv_expected, rtol=1e-10, atol=1e-10)
     assert dv_num > 0.0
+
+
+def test_tsiolkovsky_delta_v_fast_path_matches_symbolic():
+    """Float inputs take the math.log path; the value equals the symbolic one."""
+    Isp, g0, m0, mf = sp.symbols("Isp g0 m0 mf", positive=True)
+    values = {Isp: 300.0, g0: 9.80665, m0: 500.0, mf: 200.0}
+
+    dv_fast = tsiolkovsky_delta_v(300.0, 9.80665, 500.0, 200.0)
+    dv_sym = tsiolkovsky_delta_v(Isp, g0, m0, mf)
+
+    assert isinstance(dv_fast, sp.Float)
+    assert np.isclose(float(dv_fast), float(sp.N(dv_sym.subs(values))),
+                      rtol=1e-12, atol=0.0)
+
+    # Integer-only inputs stay exact.
+    assert tsiolkovsky_delta_v(300, 10, 2, 1) == 3000 * sp.log(2)